@@ -28,16 +28,19 @@ Data layout:
 from __future__ import annotations
 
 import json
+import math
+import os
+import pickle
 import re
+import stat
+import tempfile
 import time
 from pathlib import Path
 from typing import Annotated, Any
 
 import httpx
 import typer
-from filelock import FileLock
 from rich.console import Console
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 
 # -- Paths --
 DATA_DIR = Path(__file__).parent / "data" / "dblp"
@@ -52,41 +55,54 @@ DBLP_BASE = "https://dblp.org"
 # -- Title normalization (Rebiber approach) --
 
 
+_NON_ALPHA_RE = re.compile(r"[^a-zA-Z]")
+# BibTeX case-protection braces: dropped with str.translate, no regex needed.
+_STRIP_BRACES = str.maketrans("", "", "{}")
+
+
 def normalize_title(title: str) -> str:
     """Strip non-alpha characters and lowercase for fuzzy title matching."""
-    return re.sub(r"[^a-zA-Z]", "", title).lower()
+    return _NON_ALPHA_RE.sub("", title).lower()
 
 
 # -- BibTeX field extraction --
 
 
-def _bib_field(bibtex: str, name: str) -> str | None:
-    """Extract a field value from a BibTeX entry. Handles both {value} and bare value."""
-    # Try braced: field = {value},
-    m = re.search(rf"^\s*{name}\s*=\s*\{{(.+?)\}}\s*[,}}]", bibtex, re.MULTILINE | re.DOTALL)
-    if m:
-        return m.group(1).strip()
-    # Try bare: field = value,
-    m = re.search(rf"^\s*{name}\s*=\s*([^,\s]+)\s*,", bibtex, re.MULTILINE)
-    return m.group(1).strip() if m else None
+# One pass over the entry: braced (field = {value},) or bare (field = value,) values.
+_BIB_FIELD_RE = re.compile(r"^\s*(\w+)\s*=\s*(?:\{(.+?)\}\s*[,}]|([^,\s]+)\s*,)", re.MULTILINE | re.DOTALL)
+
+
+def _bib_fields(bibtex: str) -> dict[str, str]:
+    """Extract all field values from a BibTeX entry in one scan. First occurrence of a field wins."""
+    fields: dict[str, str] = {}
+    for m in _BIB_FIELD_RE.finditer(bibtex):
+        braced, bare = m.group(2), m.group(3)
+        fields.setdefault(m.group(1), (braced if braced is not None else bare).strip())
+    return fields
+
+
+_BIB_KEY_RE = re.compile(r"@\w+\{([^,]+),")
 
 
 def _bib_key(bibtex: str) -> str | None:
     """Extract the entry key from @type{key, ...}."""
-    m = re.match(r"@\w+\{([^,]+),", bibtex)
+    m = _BIB_KEY_RE.match(bibtex)
     return m.group(1).strip() if m else None
 
 
+_AUTHOR_SEP_RE = re.compile(r"\s+and\s+")
+
+
 def _structured_from_bibtex(bibtex: str) -> dict[str, Any]:
     """Build structured entry from raw BibTeX string."""
-    raw_title = _bib_field(bibtex, "title") or ""
-    clean_title = re.sub(r"[{}]", "", raw_title).rstrip(".")
-    author_str = _bib_field(bibtex, "author") or ""
-    authors = [a.strip() for a in re.split(r"\s+and\s+", author_str)] if author_str else []
+    fields = _bib_fields(bibtex)
+    clean_title = fields.get("title", "").translate(_STRIP_BRACES).rstrip(".")
+    author_str = fields.get("author")
+    authors = _AUTHOR_SEP_RE.split(author_str) if author_str else []
     return {
         "title": clean_title,
-        "venue": _bib_field(bibtex, "booktitle") or _bib_field(bibtex, "journal"),
-        "year": _bib_field(bibtex, "year"),
+        "venue": fields.get("booktitle") or fields.get("journal"),
+        "year": fields.get("year"),
         "key": _bib_key(bibtex),
         "authors": authors,
         "bibtex": bibtex,
@@ -188,39 +204,34 @@ def _year_range(conf: dict[str, Any]) -> list[int]:
 # -- BibTeX parsing --
 
 
+_ENTRY_START_RE = re.compile(r"(?=@\w+\{)")
+_TITLE_FIELD_RE = re.compile(r"^\s*title\s*=\s*\{(.+?)\}\s*[,}]", re.MULTILINE | re.DOTALL)
+# Noisy DBLP metadata fields. A run of adjacent ones goes in a single match, like the old one-re.sub-per-field passes.
+_NOISY_FIELDS_RE = re.compile(
+    r"^\s*(?:(?:month|timestamp|biburl|bibsource)\s*=\s*\{[^}]*\}\s*,?\s*\n?)+",
+    re.MULTILINE,
+)
+
+
 def _parse_bib_entries(bib_text: str) -> list[tuple[str, str]]:
     """Parse BibTeX text into (normalized_title, raw_bibtex_string) pairs."""
     results: list[tuple[str, str]] = []
-    entries = re.split(r"(?=@\w+\{)", bib_text)
+    entries = _ENTRY_START_RE.split(bib_text)
 
     for entry in entries:
         entry = entry.strip()
         if not entry or not entry.startswith("@"):
             continue
 
-        title_match = re.search(
-            r"^\s*title\s*=\s*\{(.+?)\}\s*[,}]",
-            entry,
-            re.MULTILINE | re.DOTALL,
-        )
+        title_match = _TITLE_FIELD_RE.search(entry)
         if not title_match:
             continue
 
-        title = title_match.group(1).strip()
-        clean_title = re.sub(r"[{}]", "", title)
-        norm = normalize_title(clean_title)
+        norm = normalize_title(title_match.group(1))  # braces are non-alpha, so this drops them too
 
         if norm:
             # Remove noisy DBLP metadata fields
-            cleaned = entry
-            for field in ("month", "timestamp", "biburl", "bibsource"):
-                cleaned = re.sub(
-                    rf"^\s*{field}\s*=\s*\{{[^}}]*\}}\s*,?\s*\n?",
-                    "",
-                    cleaned,
-                    flags=re.MULTILINE,
-                )
-            results.append((norm, cleaned.strip()))
+            results.append((norm, _NOISY_FIELDS_RE.sub("", entry).strip()))
 
     return results
 
@@ -233,6 +244,11 @@ def _year_path(conf_name: str, year: int) -> Path:
     return DATA_DIR / conf_name / f"{year}.json"
 
 
+def _index_path() -> Path:
+    """Path to the persisted title index used by search (not tracked; rebuilt on demand)."""
+    return DATA_DIR / "_search_index.pickle"
+
+
 def _status_path(conf_name: str) -> Path:
     """Path to the status file for a conference directory."""
     return DATA_DIR / conf_name / "_status.json"
@@ -249,13 +265,47 @@ def _load_status(conf_name: str) -> dict[str, Any]:
         return {"complete_years": [], "pages_done": {}}
 
 
+def _atomic_write_json(path: Path, data: Any) -> None:
+    """Write JSON via a temp file + rename, so an interrupted sync never leaves a truncated file behind."""
+    _atomic_write(path, json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+# Read once at import (os.umask can only be queried by setting it); _atomic_write applies it to new files.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _atomic_write(path: Path, content: bytes) -> None:
+    """Write bytes via a temp file + rename. The temp name ends in .tmp, so globs for *.json never see it.
+
+    The result keeps the target's mode, or gets the umask default for a new file, as a plain write would.
+    """
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(content)
+            tmp.flush()
+            os.chmod(tmp_name, mode)  # mkstemp creates the file 0600
+            os.fsync(tmp.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)  # interrupted or failed: don't leave the .tmp behind
+        raise
+
+
 def _save_status(conf_name: str, status: dict[str, Any]) -> None:
     """Save sync status for a conference with file locking."""
+    from filelock import FileLock
+
     path = _status_path(conf_name)
     path.parent.mkdir(parents=True, exist_ok=True)
     lock = FileLock(str(path) + ".lock")
     with lock:
-        path.write_text(json.dumps(status, indent=2, ensure_ascii=False))
+        _atomic_write_json(path, status)
 
 
 def _load_year(conf_name: str, year: int) -> dict[str, str]:
@@ -271,11 +321,13 @@ def _load_year(conf_name: str, year: int) -> dict[str, str]:
 
 def _save_year(conf_name: str, year: int, data: dict[str, str]) -> Path:
     """Save a single year file with file locking. Creates directories as needed."""
+    from filelock import FileLock
+
     path = _year_path(conf_name, year)
     path.parent.mkdir(parents=True, exist_ok=True)
     lock = FileLock(str(path) + ".lock")
     with lock:
-        path.write_text(json.dumps(data, indent=2, ensure_ascii=False))
+        _atomic_write_json(path, data)
     return path
 
 
@@ -296,6 +348,25 @@ def _build_toc_query(conf_name: str, conf: dict[str, Any], year: int) -> str:
     return f"toc:db/conf/{dblp_dir}/{conf_name}{year}.bht:"
 
 
+# Same parsing rule as paper_sources._retry_after, with a longer cap: sync is an unattended bulk download,
+# where sitting out a long window beats losing the page, while paper_sources serves an interactive command.
+_MAX_RETRY_AFTER = 300.0
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds form only), capped at _MAX_RETRY_AFTER.
+
+    None for a missing, negative or non-finite value, so the caller's fixed schedule applies.
+    """
+    try:
+        seconds = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+    if not math.isfinite(seconds) or seconds < 0:
+        return None
+    return min(seconds, _MAX_RETRY_AFTER)
+
+
 def _fetch_page(
     client: httpx.Client,
     query: str,
@@ -314,7 +385,9 @@ def _fetch_page(
         try:
             resp = client.get(url, params=params)
             if resp.status_code == 429:
-                wait = (attempt + 1) * 20
+                wait = _retry_after(resp)  # DBLP says how long its window is
+                if wait is None:
+                    wait = (attempt + 1) * 20
                 console.print(f"  [yellow]Rate limited, waiting {wait}s...[/]", highlight=False)
                 time.sleep(wait)
                 continue
@@ -340,8 +413,7 @@ def _fetch_page(
     if not bib_text:
         return []
 
-    parsed = _parse_bib_entries(bib_text)
-    return parsed if parsed else []
+    return _parse_bib_entries(bib_text)
 
 
 def _fetch_query_all_pages(
@@ -364,8 +436,7 @@ def _fetch_query_all_pages(
         if not parsed:
             break
 
-        for norm_title, bib_entry in parsed:
-            entries[norm_title] = bib_entry
+        entries.update(parsed)  # (norm_title, bibtex) pairs; last write wins, as before
 
         if len(parsed) < 900:
             break
@@ -401,6 +472,8 @@ def _download_venue_year(
     dblp_dir = conf["dir"]
     all_entries: dict[str, str] = {}
     all_ok = True
+    # Shared by the suffix, split-part and extra-volume fallbacks below
+    toc_prefix = f"toc:db/conf/{dblp_dir}/{conf_name}{year}"
 
     # 1. Try base query
     base_query = _build_toc_query(conf_name, conf, year)
@@ -414,7 +487,7 @@ def _download_venue_year(
         for suffix in conf.get("suffixes", []):
             if not suffix:
                 continue
-            suffix_query = f"toc:db/conf/{dblp_dir}/{conf_name}{year}{suffix}.bht:"
+            suffix_query = f"{toc_prefix}{suffix}.bht:"
             entries, ok = _fetch_query_all_pages(client, suffix_query, console)
             if entries:
                 all_entries.update(entries)
@@ -427,7 +500,7 @@ def _download_venue_year(
         if not all_entries and db_type != "journals":
             num_parts = 0
             for part in range(1, 50):  # safety cap
-                part_query = f"toc:db/conf/{dblp_dir}/{conf_name}{year}-{part}.bht:"
+                part_query = f"{toc_prefix}-{part}.bht:"
                 part_entries, part_ok = _fetch_query_all_pages(client, part_query, console)
                 if not part_entries:
                     break
@@ -441,7 +514,7 @@ def _download_venue_year(
 
     # 4. Always fetch extra toc volumes (e.g. Findings) and merge
     for extra in conf.get("extra_tocs", []):
-        extra_query = f"toc:db/conf/{dblp_dir}/{conf_name}{year}{extra}.bht:"
+        extra_query = f"{toc_prefix}{extra}.bht:"
         extra_entries, extra_ok = _fetch_query_all_pages(client, extra_query, console)
         if extra_entries:
             console.print(f"    [dim]+{len(extra_entries)} from {conf_name}{year}{extra}[/]", highlight=False)
@@ -470,6 +543,9 @@ def sync(
         years: Only sync these specific years (default: all years for each conference).
         force: Re-download even complete years (merges with existing data).
     """
+    # Only sync needs progress bars; search (imported by paper_sources) shouldn't load them.
+    from rich.progress import BarColumn, Progress, SpinnerColumn, TaskProgressColumn, TextColumn
+
     console = console or Console(stderr=True)
 
     targets = conferences or list(CONFERENCES.keys())
@@ -481,7 +557,9 @@ def sync(
 
     failures: list[tuple[str, int]] = []
 
-    with httpx.Client(timeout=60.0) as client:
+    # Pages are fetched 2-5s apart; keep the connection alive across those pauses.
+    limits = httpx.Limits(keepalive_expiry=60.0)
+    with httpx.Client(timeout=60.0, limits=limits) as client:
         for conf_name in targets:
             conf = CONFERENCES[conf_name]
             conf_dir = conf["dir"]
@@ -605,35 +683,88 @@ def _check_db_completeness() -> list[tuple[str, int]]:
     return incomplete
 
 
-def _load_db() -> dict[str, str]:
-    """Load all year JSON files from data directory into a single lookup dict."""
-    db: dict[str, str] = {}
+def _search_index(want: str = "") -> tuple[list[Path], dict[str, int], dict[int, dict[str, str]]]:
+    """Return (year file paths, {normalized_title: index into paths}, already-parsed year files).
+
+    Building it means parsing every year file, so the result is pickled to _index_path()
+    together with each file's (path, mtime, size) and reused until a sync changes any of them.
+    When a title appears in several files, the last one in rglob order wins, as when the files were
+    merged into one dict.
+    On a rebuild, the file holding ``want`` is handed back parsed so the caller needn't read it again.
+    """
     if not DATA_DIR.exists():
-        return db
-    for path in DATA_DIR.rglob("*.json"):
-        if path.name.startswith("_"):
-            continue
+        return [], {}, {}
+    paths = [p for p in DATA_DIR.rglob("*.json") if not p.name.startswith("_")]
+    signature = []
+    for p in paths:
+        st = p.stat()
+        signature.append((str(p.relative_to(DATA_DIR)), st.st_mtime_ns, st.st_size))
+
+    index_path = _index_path()
+    try:
+        cached = pickle.loads(index_path.read_bytes())
+        if cached["signature"] == signature:
+            return paths, cached["titles"], {}
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, TypeError, ValueError):
+        pass  # missing, stale format or corrupt: rebuild below
+
+    titles: dict[str, int] = {}
+    parsed: dict[int, dict[str, str]] = {}
+    for i, path in enumerate(paths):
         try:
             data = json.loads(path.read_text())
-            db.update(data)
         except (json.JSONDecodeError, OSError):
             continue
-    return db
+        if want in data:
+            parsed = {i: data}  # a later file holding it replaces the earlier one, as in titles
+        titles.update(dict.fromkeys(data, i))
+    try:
+        _atomic_write(index_path, pickle.dumps({"signature": signature, "titles": titles}, pickle.HIGHEST_PROTOCOL))
+    except OSError:
+        pass  # read-only data dir: still searchable, just not cached
+    return paths, titles, parsed
 
 
-def search(title: str, max_results: int = 5) -> list[dict[str, Any]]:
+def search(title: str, max_results: int = 5, *, exact_only: bool = False) -> list[dict[str, Any]]:
     """Search local DBLP database by title.
 
     Tries exact normalized match first (returns single-element list),
     then falls back to substring match (returns up to max_results candidates
-    sorted by key length, shortest first).
+    sorted by key length, shortest first). With exact_only, a miss returns []
+    right away: no completeness check, no substring scan.
+
+    Only normalized titles are scanned, from the index cached by _search_index;
+    year files are read only for the hits that are returned.
 
     Returns list of structured dicts with keys: title, venue, year, key, authors, bibtex.
     Returns empty list if not found.
 
     Raises:
-        IncompleteDBError: If the database has incomplete (partially synced) years.
+        IncompleteDBError: If there is no exact match and the database has incomplete
+            (partially synced) years. An exact match is conclusive either way, so the
+            completeness check only runs when the answer could depend on missing data.
     """
+    norm = normalize_title(title)
+    if not norm:
+        return []  # nothing alphabetic to match on; skip the scan entirely
+
+    paths, titles, loaded = _search_index(norm)
+
+    def bibtex_for(norm_title: str) -> str | None:
+        i = titles[norm_title]
+        if i not in loaded:
+            try:
+                loaded[i] = json.loads(paths[i].read_text())
+            except (json.JSONDecodeError, OSError):
+                loaded[i] = {}
+        return loaded[i].get(norm_title)
+
+    # Exact match (O(1))
+    if norm in titles and (entry := bibtex_for(norm)) is not None:
+        return [_structured_from_bibtex(entry)]
+    if exact_only:
+        return []
+
     incomplete = _check_db_completeness()
     if incomplete:
         details = ", ".join(f"{c}/{y}" for c, y in incomplete[:10])
@@ -643,23 +774,14 @@ def search(title: str, max_results: int = 5) -> list[dict[str, Any]]:
             f"Run 'dblp_local.py sync' to complete download."
         )
 
-    db = _load_db()
-    norm = normalize_title(title)
-
-    # Exact match (O(1))
-    entry = db.get(norm)
-    if entry is not None:
-        return [_structured_from_bibtex(entry)]
-
-    # Substring match: find entries whose key contains the query
+    # Substring match needs a long enough query, or it would match too many
     if len(norm) < 10:
-        return []  # too short, would match too many
-    matches = [(k, v) for k, v in db.items() if norm in k]
-    if not matches:
         return []
+    matches = [k for k in titles if norm in k]
     # Sort by key length (shortest = closest match), return top N
-    matches.sort(key=lambda x: len(x[0]))
-    return [_structured_from_bibtex(v) for _, v in matches[:max_results]]
+    matches.sort(key=len)
+    hits = (bibtex_for(k) for k in matches[:max_results])
+    return [_structured_from_bibtex(entry) for entry in hits if entry is not None]
 
 
 # -- CLI --
@@ -703,7 +825,7 @@ def cli_search(
     except IncompleteDBError as e:
         console = Console(stderr=True)
         console.print(f"[red]Error: {e}[/]")
-        raise typer.Exit(2)
+        raise typer.Exit(2) from None
 
     if not results:
         if json_output:
@@ -739,7 +861,7 @@ def cli_stats() -> None:
         status = _load_status(conf_dir.name)
         complete_years = set(status.get("complete_years", []))
         pages_done = status.get("pages_done", {})
-        incomplete_count = len([y for y in pages_done if int(y) not in complete_years])
+        incomplete_count = sum(1 for y in pages_done if int(y) not in complete_years)
 
         conf_count = 0
         year_files = sorted(p for p in conf_dir.glob("*.json") if not p.name.startswith("_"))
@@ -752,8 +874,7 @@ def cli_stats() -> None:
         total += conf_count
         year_range = ""
         if year_files:
-            years_list = [p.stem for p in year_files]
-            year_range = f" ({years_list[0]}–{years_list[-1]})"
+            year_range = f" ({year_files[0].stem}–{year_files[-1].stem})"
         inc_tag = f" [yellow]({incomplete_count} incomplete)[/]" if incomplete_count else ""
         console.print(
             f"  {conf_dir.name:20s} {conf_count:>6,} entries  {len(complete_years):>3} complete{year_range}{inc_tag}"
@@ -765,13 +886,13 @@ def cli_stats() -> None:
 @app.command("list-conferences")
 def cli_list_conferences() -> None:
     """List all supported conferences."""
-    console = Console()
-    for name, conf in sorted(CONFERENCES.items()):
-        years = _year_range(conf)
-        year_range = f"{years[0]}–{years[-1]}"
-        db_type = conf.get("type", "conf")
-        tag = f"[dim]({db_type})[/]" if db_type != "conf" else ""
-        console.print(f"  {name:20s} {year_range:15s} {tag}")
+    with Console() as console:  # buffered: the whole list reaches the terminal in one write
+        for name, conf in sorted(CONFERENCES.items()):
+            years = _year_range(conf)
+            year_range = f"{years[0]}–{years[-1]}"
+            db_type = conf.get("type", "conf")
+            tag = f"[dim]({db_type})[/]" if db_type != "conf" else ""
+            console.print(f"  {name:20s} {year_range:15s} {tag}")
 
 
 @app.command("reset-status")
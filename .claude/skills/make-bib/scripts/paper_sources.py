@@ -2,7 +2,7 @@
 # /// script
 # requires-python = ">=3.10"
 # dependencies = [
-#     "httpx",
+#     "httpx[http2]",
 #     "hishel[httpx]",
 #     "rich",
 #     "typer",
@@ -18,46 +18,85 @@ Run with --help for full usage, source descriptions, and output format details.
 from __future__ import annotations
 
 import json
+import math
 import os
 import re
 import sys
+import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 from typing import Annotated, Any, Literal, Optional
-from urllib.parse import quote
+from urllib.parse import quote, urlencode
 
-import hishel
-from hishel.httpx import SyncCacheTransport
 import httpx
 import typer
 from dotenv import load_dotenv
 from rich.console import Console
+from rich.text import Text
 
 load_dotenv()
+# Read once, after .env is merged in; the request helpers below run per call.
+_S2_API_KEY = os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
+_CROSSREF_EMAIL = os.environ.get("CROSSREF_EMAIL")
 
 # -- Type alias --
 SourceData = dict[str, Any]
 
 # -- HTTP client with cache --
 _CACHE_DIR = Path.home() / ".cache" / "make-bib"
+# Rate-limit intervals reach 3.5s (arXiv); keep idle connections well past that to skip TLS re-handshakes.
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=30.0)
+# Final answers only: successes, plus 404/410 so known misses aren't re-asked for a day.
+# 429s and 5xx are transient; caching them would replay the failure to _request's retries.
+_CACHEABLE_STATUS = frozenset({*range(200, 300), 404, 410})
+# arXiv answers a rejected id_list with a 200 feed whose entry id points here; not a final answer either.
+_ARXIV_ERROR_MARK = b"arxiv.org/api/errors"
+# Sent to every host from the shared client; CrossRef appends a mailto for its polite pool.
+_USER_AGENT = "paper_sources/0.1 (https://github.com/bibtools)"
+
+
+def _make_client(timeout: float = 30.0, *, cache: bool = True) -> httpx.Client:
+    """Create an httpx Client with transparent HTTP caching via hishel (cache=False: network only)."""
+    # HTTP/2 where the server offers it (negotiated via ALPN, HTTP/1.1 otherwise): concurrent fetches
+    # to one host share a single multiplexed connection instead of each opening its own TLS session.
+    network = _RateLimitedTransport(httpx.HTTPTransport(limits=_HTTP_LIMITS, http2=True))
+    if not cache:
+        return httpx.Client(transport=network, timeout=timeout, headers={"User-Agent": _USER_AGENT})
+
+    # Deferred so --help and argument errors don't pay for hishel (and its sqlite backend).
+    import hishel
+    from hishel.httpx import SyncCacheTransport
+
+    class _FinalResponses(hishel.BaseFilter[hishel.Response]):
+        def needs_body(self) -> bool:
+            return False
+
+        def apply(self, item: hishel.Response, body: bytes | None) -> bool:
+            return item.status_code in _CACHEABLE_STATUS
+
+    class _NoArxivErrorFeeds(hishel.BaseFilter[hishel.Response]):
+        def needs_body(self) -> bool:
+            return True
+
+        def apply(self, item: hishel.Response, body: bytes | None) -> bool:
+            return _ARXIV_ERROR_MARK not in (body or b"")
 
-
-def _make_client(timeout: float = 30.0) -> httpx.Client:
-    """Create an httpx Client with transparent HTTP caching via hishel."""
     _CACHE_DIR.mkdir(parents=True, exist_ok=True)
     storage = hishel.SyncSqliteStorage(
         default_ttl=86400,
         database_path=str(_CACHE_DIR / "http_cache.db"),
     )
     transport = SyncCacheTransport(
-        httpx.HTTPTransport(),
+        network,
         storage=storage,
-        policy=hishel.FilterPolicy(),  # cache all responses regardless of headers
+        # FilterPolicy ignores cache headers
+        policy=hishel.FilterPolicy(response_filters=[_FinalResponses(), _NoArxivErrorFeeds()]),
     )
-    return httpx.Client(transport=transport, timeout=timeout)
+    return httpx.Client(transport=transport, timeout=timeout, headers={"User-Agent": _USER_AGENT})
 
 
 # =============================================================================
@@ -80,20 +119,18 @@ def _get_dblp_local():
     return _dblp_local
 
 
-def _dblp_local_search(title: str) -> list[dict[str, Any]]:
+def _dblp_local_search(title: str, *, exact_only: bool = False) -> list[dict[str, Any]]:
     """Search local DBLP DB by title. Returns list of structured hits.
 
-    Raises dblp_local.IncompleteDBError if the database has incomplete data.
+    Raises dblp_local.IncompleteDBError if the database has incomplete data (never with exact_only).
     """
     try:
         mod = _get_dblp_local()
     except ImportError:
         return []
     try:
-        return mod.search(title)
-    except mod.IncompleteDBError:
-        raise
-    except Exception:
+        return mod.search(title, exact_only=exact_only)
+    except (OSError, ValueError):
         return []
 
 
@@ -103,23 +140,34 @@ def _dblp_local_search(title: str) -> list[dict[str, Any]]:
 
 
 class RateLimiter:
-    """Enforces minimum interval between requests to a single API."""
+    """Enforces minimum interval between requests to a single API. Thread-safe.
+
+    Each caller reserves the next free slot under the lock and sleeps outside it, so waiting
+    threads queue up in order without holding the lock through each other's sleeps.
+    """
 
     def __init__(self, min_interval: float):
         self.min_interval = min_interval
-        self._last: float = 0.0
+        self._next: float = 0.0  # monotonic time the next request may go out
+        self._lock = threading.Lock()
 
     def wait(self) -> None:
-        now = time.monotonic()
-        elapsed = now - self._last
-        if elapsed < self.min_interval:
-            time.sleep(self.min_interval - elapsed)
-        self._last = time.monotonic()
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def penalize(self, seconds: float) -> None:
+        """Hold back every request to this API for `seconds` (e.g. after a 429)."""
+        with self._lock:
+            self._next = max(self._next, time.monotonic() + seconds)
 
 
 def _s2_interval() -> float:
     """S2: 1 rps with API key, 3s without (shared unauthenticated pool, only used with --allow-no-s2-key)."""
-    return 1.0 if os.environ.get("SEMANTIC_SCHOLAR_API_KEY") else 3.0
+    return 1.0 if _S2_API_KEY else 3.0
 
 
 _RATE_LIMITERS: dict[str, RateLimiter] = {
@@ -133,11 +181,31 @@ _RATE_LIMITERS: dict[str, RateLimiter] = {
 }
 
 
-def _rate_limit(url: str) -> None:
+def _limiter_for(host: str) -> RateLimiter | None:
+    """Limiter for a request host: a listed host, or a subdomain of one. Never the path or query."""
     for domain, limiter in _RATE_LIMITERS.items():
-        if domain in url:
-            limiter.wait()
-            return
+        if host == domain or host.endswith("." + domain):
+            return limiter
+    return None
+
+
+def _rate_limit(host: str) -> None:
+    if limiter := _limiter_for(host):
+        limiter.wait()
+
+
+class _RateLimitedTransport(httpx.BaseTransport):
+    """Rate-limits requests that actually go out. Sits under the cache, so cache hits never wait."""
+
+    def __init__(self, transport: httpx.BaseTransport):
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        _rate_limit(request.url.host)
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        self._transport.close()
 
 
 # =============================================================================
@@ -145,7 +213,29 @@ def _rate_limit(url: str) -> None:
 # =============================================================================
 
 
-@dataclass(frozen=True)
+def _strip_arxiv_version(arxiv_id: str) -> str:
+    """'2010.11929v2' → '2010.11929'."""
+    head, v, version = arxiv_id.rpartition("v")
+    # "solv-int/9901001" has a "v" too, but no digits-only suffix after the last one
+    return head if v and version.isdigit() else arxiv_id
+
+
+# Resolver URL or a doubled "doi:" that users paste along with the DOI itself
+_DOI_PREFIX_RE = re.compile(r"^(?:https?://(?:dx\.)?doi\.org/|doi:)", re.IGNORECASE)
+_ACL_DOI_RE = re.compile(r"^10\.18653/v1/(.+)$")
+# Shape checks for input IDs: anything else can only 404, so it is rejected before a request goes out.
+_DOI_RE = re.compile(r"^10\.\d{4,9}/\S+$")
+_ARXIV_ID_RE = re.compile(r"^(?:\d{4}\.\d{4,5}|[a-z-]+(?:\.[A-Z]{2})?/\d{7})$")
+
+
+def _same_id(field: str, a: str | None, b: str | None) -> bool:
+    """ID equality; DOIs are case-insensitive, other IDs (OpenReview, ACL) are not."""
+    if field == "doi" and a and b:
+        return a.lower() == b.lower()
+    return a == b
+
+
+@dataclass(frozen=True, slots=True)
 class PaperId:
     """Parsed paper identifier. Always requires explicit type prefix.
 
@@ -169,12 +259,21 @@ class PaperId:
                 f"Missing type prefix in {s!r}. Expected format: {{type}}:{{value}} where type is one of {cls.TYPES}"
             )
         type_str, value = s.split(":", 1)
+        type_str = type_str.lower()  # accept arXiv's own "arXiv:2010.11929" spelling
         if type_str not in cls.TYPES:
             raise ValueError(f"Unknown type {type_str!r}. Expected one of {cls.TYPES}")
+        if type_str == "doi":
+            value = _DOI_PREFIX_RE.sub("", value, count=1)  # normalized once here, so callers get a bare DOI
+        elif type_str == "arxiv" and value[:6].lower() == "arxiv:":
+            value = value[6:]  # "arxiv:arXiv:2010.11929", as copied from an arXiv page
         if not value:
             raise ValueError("Empty value after prefix")
         if type_str == "arxiv":
-            value = re.sub(r"v\d+$", "", value)
+            value = _strip_arxiv_version(value)
+            if not _ARXIV_ID_RE.match(value):
+                raise ValueError(f"Malformed arXiv ID {value!r}. Expected e.g. 2010.11929 or hep-th/9901001")
+        elif type_str == "doi" and not _DOI_RE.match(value):
+            raise ValueError(f"Malformed DOI {value!r}. Expected 10.<registrant>/<suffix>")
         return cls(type_str, value)  # type: ignore[arg-type]
 
     def to_s2_query(self) -> str:
@@ -205,7 +304,7 @@ class PaperId:
                 ids["arxiv_id"] = self.value
             case "doi":
                 ids["doi"] = self.value
-                m = re.match(r"^10\.18653/v1/(.+)$", self.value)
+                m = _ACL_DOI_RE.match(self.value)
                 if m:
                     ids["acl_id"] = m.group(1)
             case "openreview":
@@ -217,16 +316,45 @@ class PaperId:
 
 def _get(client: httpx.Client, url: str, *, headers: dict | None = None, **kwargs: Any) -> httpx.Response | None:
     """GET with retry on 429. Returns None on 404/410. Raises on other errors."""
-    _rate_limit(url)
+    return _request(client, "GET", url, headers=headers, **kwargs)
+
+
+# Longest server-requested pause honored; past that, failing is more useful than stalling the command.
+_MAX_RETRY_AFTER = 60.0
+
+
+def _retry_after(resp: httpx.Response) -> float | None:
+    """Seconds from a Retry-After header (delta-seconds form only), capped at _MAX_RETRY_AFTER.
+
+    None for a missing, negative or non-finite value, so the caller's fixed schedule applies.
+    """
+    try:
+        seconds = float(resp.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return None
+    if not math.isfinite(seconds) or seconds < 0:
+        return None
+    return min(seconds, _MAX_RETRY_AFTER)
+
+
+def _request(
+    client: httpx.Client, method: str, url: str, *, headers: dict | None = None, **kwargs: Any
+) -> httpx.Response | None:
+    """Send with retry on 429. Returns None on 404/410. Raises on other errors."""
     hdrs = headers or {}
     for attempt in range(3):
-        resp = client.get(url, headers=hdrs, **kwargs)
+        resp = client.request(method, url, headers=hdrs, **kwargs)
         if resp.status_code in (404, 410):
             return None
         if resp.status_code == 429:
-            wait = (attempt + 1) * 5
+            wait = _retry_after(resp)  # the server knows when its window reopens; 0 means retry now
+            if wait is None:
+                wait = (attempt + 1) * 5
             print(f"  Rate limited ({url[:60]}…), retrying in {wait}s…", file=sys.stderr)
-            time.sleep(wait)
+            if limiter := _limiter_for(httpx.URL(url).host):
+                limiter.penalize(wait)  # back off the whole host; the retry waits in the transport
+            else:
+                time.sleep(wait)
             continue
         resp.raise_for_status()
         return resp
@@ -234,11 +362,7 @@ def _get(client: httpx.Client, url: str, *, headers: dict | None = None, **kwarg
 
 
 def _crossref_headers() -> dict[str, str]:
-    ua = "paper_sources/0.1 (https://github.com/bibtools)"
-    email = os.environ.get("CROSSREF_EMAIL")
-    if email:
-        ua += f" (mailto:{email})"
-    return {"User-Agent": ua}
+    return {"User-Agent": f"{_USER_AGENT} (mailto:{_CROSSREF_EMAIL})"} if _CROSSREF_EMAIL else {}
 
 
 def _skipped(name: str, reason: str) -> SourceData:
@@ -258,8 +382,7 @@ _S2_FIELDS = "paperId,externalIds,venue,title"
 
 
 def _s2_headers() -> dict[str, str]:
-    key = os.environ.get("SEMANTIC_SCHOLAR_API_KEY")
-    return {"x-api-key": key} if key else {}
+    return {"x-api-key": _S2_API_KEY} if _S2_API_KEY else {}
 
 
 def resolve_s2(client: httpx.Client, pid: PaperId) -> SourceData:
@@ -279,13 +402,54 @@ def resolve_s2(client: httpx.Client, pid: PaperId) -> SourceData:
     return {"source": "semantic_scholar", "request": req, "status": "ok", "response": resp.json()}
 
 
+# /paper/batch accepts at most 500 IDs per request.
+_S2_BATCH_SIZE = 500
+
+
+def resolve_s2_batch(client: httpx.Client, pids: list[PaperId]) -> list[SourceData]:
+    """Resolve several paper IDs with S2's ``/paper/batch`` endpoint. Returns results in input order."""
+    results: list[SourceData] = []
+    for i in range(0, len(pids), _S2_BATCH_SIZE):
+        results.extend(_resolve_s2_page(client, pids[i : i + _S2_BATCH_SIZE]))
+    return results
+
+
+def _resolve_s2_page(client: httpx.Client, pids: list[PaperId]) -> list[SourceData]:
+    """Resolve up to _S2_BATCH_SIZE paper IDs in a single ``/paper/batch`` POST."""
+    url = f"{_S2_BASE}/paper/batch"
+    params = {"fields": _S2_FIELDS}
+    body = {"ids": [pid.to_s2_query() for pid in pids]}
+    req = {"url": url, "params": params, "json": body}
+
+    try:
+        # Every batch shares one URL, so the cache key has to include the body.
+        resp = _request(
+            client, "POST", url, headers=_s2_headers(), params=params, json=body, extensions={"hishel_body_key": True}
+        )
+    except httpx.HTTPError as e:
+        return [_error("semantic_scholar", req, str(e)) for _ in pids]
+    if not resp:
+        return [_error("semantic_scholar", req, "not found") for _ in pids]
+
+    # One slot per requested ID, in request order; null where S2 has no match.
+    results = [
+        {"source": "semantic_scholar", "request": req, "status": "ok", "response": paper}
+        if paper
+        else _error("semantic_scholar", req, "not found")
+        for paper in resp.json()[: len(pids)]
+    ]
+    # A short reply must not shift or drop papers downstream; report the slots it left out
+    results += [_error("semantic_scholar", req, "missing from batch response") for _ in pids[len(results) :]]
+    return results
+
+
 # =============================================================================
 # Exact-fetch functions (ID-based, no judgment)
 # =============================================================================
 
 
 def fetch_crossref(client: httpx.Client, doi: str, *, raw: bool = False) -> SourceData:
-    url = f"https://api.crossref.org/works/{doi}"
+    url = f"https://api.crossref.org/works/{quote(doi, safe='/')}"  # DOIs may contain '#', '?', ';'…
     req = {"url": url}
 
     try:
@@ -296,24 +460,79 @@ def fetch_crossref(client: httpx.Client, doi: str, *, raw: bool = False) -> Sour
         return {"source": "crossref", "request": req, "status": "no_match"}
 
     msg = resp.json().get("message", {})
+    return {"source": "crossref", "request": req, "status": "ok", "response": _crossref_record(msg, raw=raw)}
+
+
+def _crossref_record(msg: dict, *, raw: bool) -> dict[str, Any]:
+    """Convert a CrossRef work message to a response dict."""
     if raw:
-        response = msg
-    else:
-        response = {
-            "title": msg.get("title"),
-            "author": msg.get("author"),
-            "published": msg.get("published"),
-            "issued": msg.get("issued"),
-            "container-title": msg.get("container-title"),
-            "DOI": msg.get("DOI"),
-            "type": msg.get("type"),
-            "page": msg.get("page"),
-            "volume": msg.get("volume"),
-            "issue": msg.get("issue"),
-            "publisher": msg.get("publisher"),
-            "event": msg.get("event"),
-        }
-    return {"source": "crossref", "request": req, "status": "ok", "response": response}
+        return msg
+    return {
+        "title": msg.get("title"),
+        "author": msg.get("author"),
+        "published": msg.get("published"),
+        "issued": msg.get("issued"),
+        "container-title": msg.get("container-title"),
+        "DOI": msg.get("DOI"),
+        "type": msg.get("type"),
+        "page": msg.get("page"),
+        "volume": msg.get("volume"),
+        "issue": msg.get("issue"),
+        "publisher": msg.get("publisher"),
+        "event": msg.get("event"),
+    }
+
+
+# DOIs per filter=doi:... query; keeps the GET URL short and the response well under one page.
+_CROSSREF_BATCH_SIZE = 20
+
+
+def fetch_crossref_batch(client: httpx.Client, dois: list[str], *, raw: bool = False) -> dict[str, SourceData]:
+    """Fetch several CrossRef works with ``filter=doi:...`` queries. Returns {doi: result} in input order."""
+    results: dict[str, SourceData] = {}
+    # Commas are legal in DOIs but separate filter values, so those go through the single-DOI endpoint
+    batchable = [d for d in dois if "," not in d]
+    for i in range(0, len(batchable), _CROSSREF_BATCH_SIZE):
+        results.update(_fetch_crossref_page(client, batchable[i : i + _CROSSREF_BATCH_SIZE], raw=raw))
+    for doi in dois:
+        if doi not in results:
+            results[doi] = fetch_crossref(client, doi, raw=raw)
+    return {doi: results[doi] for doi in dois}
+
+
+def _fetch_crossref_page(client: httpx.Client, dois: list[str], *, raw: bool) -> dict[str, SourceData]:
+    """Fetch up to _CROSSREF_BATCH_SIZE CrossRef works in a single ``filter=doi:...`` query."""
+    url = "https://api.crossref.org/works"
+    params = {"filter": ",".join(f"doi:{d}" for d in dois), "rows": str(len(dois))}
+    req = {"url": url, "params": params}
+
+    try:
+        resp = _get(client, url, headers=_crossref_headers(), params=params)
+    except httpx.HTTPError as e:
+        return {doi: _error("crossref", req, str(e)) for doi in dois}
+    if not resp:
+        return {doi: {"source": "crossref", "request": req, "status": "no_match"} for doi in dois}
+
+    # DOIs are case-insensitive, and CrossRef may echo them in a different case
+    items = {(item.get("DOI") or "").lower(): item for item in resp.json().get("message", {}).get("items", [])}
+    results: dict[str, SourceData] = {}
+    for doi in dois:
+        item = items.get(doi.lower())
+        if item is None:
+            results[doi] = {"source": "crossref", "request": req, "status": "no_match"}
+        else:
+            results[doi] = {
+                "source": "crossref",
+                "request": req,
+                "status": "ok",
+                "response": _crossref_record(item, raw=raw),
+            }
+    return results
+
+
+# .bib exports addressed by a DBLP key or ACL ID are effectively final once they exist; keep them a week,
+# like arXiv records. DOI lookups keep the 1-day default, since DBLP may not have indexed a new paper yet.
+_BIB_RECORD_TTL = 7 * 86400
 
 
 def fetch_dblp(
@@ -325,9 +544,11 @@ def fetch_dblp(
     doi: str | None = None,
 ) -> SourceData:
     """Fetch DBLP record. Tries: local DB by title → .bib by key → .bib by DOI."""
-    # Try local DB by title if available (more reliable than key from S2)
+    # Try local DB by title if available (more reliable than key from S2, which is often the CoRR preprint).
+    # A published key is already the record we want: take an exact local hit (no API call), but skip the
+    # substring scan over every title, whose lone hit could be a different paper.
     if title:
-        hits = _dblp_local_search(title)
+        hits = _dblp_local_search(title, exact_only=bool(dblp_key) and not dblp_key.startswith("journals/corr/"))
         if len(hits) == 1:
             local = hits[0]
             return {
@@ -344,7 +565,7 @@ def fetch_dblp(
     if dblp_key:
         bib_url = f"https://dblp.org/rec/{dblp_key}.bib?param=0"
         try:
-            bib_resp = _get(client, bib_url)
+            bib_resp = _get(client, bib_url, extensions={"hishel_ttl": _BIB_RECORD_TTL})
             if bib_resp:
                 bibtex = bib_resp.text.strip()
                 if bibtex:
@@ -355,7 +576,7 @@ def fetch_dblp(
 
     # Fall back to DOI → DBLP direct path
     if doi:
-        doi_url = f"https://dblp.org/doi/{doi}.bib?param=0"
+        doi_url = f"https://dblp.org/doi/{quote(doi, safe='/')}.bib?param=0"
         try:
             doi_resp = _get(client, doi_url)
             if doi_resp:
@@ -369,54 +590,117 @@ def fetch_dblp(
     return _error("dblp", {}, "not found in local DB, by key, or by DOI")
 
 
-_ARXIV_NS = {"atom": "http://www.w3.org/2005/Atom", "arxiv": "http://arxiv.org/schemas/atom"}
+# Namespaces pre-expanded to Clark notation ("{uri}tag") so ElementTree skips prefix translation per lookup.
+_ATOM = "{http://www.w3.org/2005/Atom}"
+_ARXIV = "{http://arxiv.org/schemas/atom}"
+
+
+def _arxiv_id_from_entry(entry_id: str) -> str:
+    """Bare arXiv ID from an Atom entry id: 'http://arxiv.org/abs/2010.11929v2' → '2010.11929'."""
+    return _strip_arxiv_version(entry_id.rsplit("/abs/", 1)[-1])
+
+
+def _arxiv_match_key(arxiv_id: str) -> str:
+    """ID as arXiv echoes it in entry ids: no version, no subject class ('math.GT/0309136v1' → 'math/0309136')."""
+    archive, slash, number = _strip_arxiv_version(arxiv_id).rpartition("/")
+    return f"{archive.partition('.')[0]}/{number}" if slash else number
 
 
 def fetch_arxiv(client: httpx.Client, arxiv_id: str, *, raw: bool = False) -> SourceData:
+    return fetch_arxiv_batch(client, [arxiv_id], raw=raw)[arxiv_id]
+
+
+# arXiv records only change on a new version; keep them a week instead of the 1-day default.
+_ARXIV_RECORD_TTL = 7 * 86400
+
+# IDs per id_list query: well under arXiv's 2000-result cap, and keeps the GET URL a few KB.
+_ARXIV_BATCH_SIZE = 200
+
+
+def fetch_arxiv_batch(client: httpx.Client, arxiv_ids: list[str], *, raw: bool = False) -> dict[str, SourceData]:
+    """Fetch several arXiv records with ``id_list`` queries. Returns {arxiv_id: result} in input order."""
+    results: dict[str, SourceData] = {}
+    # One malformed ID gets the whole id_list query rejected, so IDs of unknown shape (S2 passes
+    # them through unchecked) go on their own, like comma DOIs in fetch_crossref_batch
+    batchable = [a for a in arxiv_ids if _ARXIV_ID_RE.match(_strip_arxiv_version(a))]
+    for i in range(0, len(batchable), _ARXIV_BATCH_SIZE):
+        results.update(_fetch_arxiv_page(client, batchable[i : i + _ARXIV_BATCH_SIZE], raw=raw))
+    for aid in arxiv_ids:
+        if aid not in results:
+            results[aid] = _fetch_arxiv_page(client, [aid], raw=raw)[aid]
+    return {aid: results[aid] for aid in arxiv_ids}
+
+
+def _fetch_arxiv_page(client: httpx.Client, arxiv_ids: list[str], *, raw: bool) -> dict[str, SourceData]:
+    """Fetch up to _ARXIV_BATCH_SIZE arXiv records in a single ``id_list`` query."""
     url = "https://export.arxiv.org/api/query"
-    params = {"id_list": arxiv_id, "max_results": "1"}
+    params = {"id_list": ",".join(arxiv_ids), "max_results": str(len(arxiv_ids))}
     req = {"url": url, "params": params}
 
     try:
-        resp = _get(client, url, params=params)
+        resp = _get(client, url, params=params, extensions={"hishel_ttl": _ARXIV_RECORD_TTL})
         if not resp:
-            return _error("arxiv", req, "not found")
+            return {aid: _error("arxiv", req, "not found") for aid in arxiv_ids}
+    except httpx.HTTPStatusError as e:
+        if e.response.status_code == 400 and len(arxiv_ids) > 1:
+            return _split_arxiv_page(client, arxiv_ids, raw=raw)
+        return {aid: _error("arxiv", req, str(e)) for aid in arxiv_ids}
     except httpx.HTTPError as e:
-        return _error("arxiv", req, str(e))
+        return {aid: _error("arxiv", req, str(e)) for aid in arxiv_ids}
 
-    root = ET.fromstring(resp.text)
-    entry = root.find("atom:entry", _ARXIV_NS)
-    if entry is None:
-        return _error("arxiv", req, "no entry in response")
+    try:
+        root = ET.fromstring(resp.content)  # raw bytes: the parser decodes per the XML declaration
+    except ET.ParseError as e:
+        return {aid: _error("arxiv", req, f"malformed response: {e}") for aid in arxiv_ids}
+    entries: dict[str, ET.Element] = {}
+    for entry in root.findall(_ATOM + "entry"):
+        entry_id = entry.findtext(_ATOM + "id", "")
+        if "error" in entry_id.lower():
+            # arXiv rejects the whole query if any ID is malformed; split the page so only the bad one fails
+            if len(arxiv_ids) > 1:
+                return _split_arxiv_page(client, arxiv_ids, raw=raw)
+            return {aid: _error("arxiv", req, f"arxiv error: {entry_id}") for aid in arxiv_ids}
+        entries[_arxiv_match_key(_arxiv_id_from_entry(entry_id))] = entry
+
+    results: dict[str, SourceData] = {}
+    for aid in arxiv_ids:
+        entry = entries.get(_arxiv_match_key(aid))
+        if entry is None:
+            results[aid] = _error("arxiv", req, "no entry in response")
+        elif raw:
+            results[aid] = {"source": "arxiv", "request": req, "status": "ok", "response": {"xml": resp.text}}
+        else:
+            results[aid] = {"source": "arxiv", "request": req, "status": "ok", "response": _arxiv_entry(entry)}
+    return results
 
-    entry_id = entry.findtext("atom:id", "", _ARXIV_NS)
-    if "error" in entry_id.lower():
-        return _error("arxiv", req, f"arxiv error: {entry_id}")
 
-    if raw:
-        return {"source": "arxiv", "request": req, "status": "ok", "response": {"xml": resp.text}}
+def _split_arxiv_page(client: httpx.Client, arxiv_ids: list[str], *, raw: bool) -> dict[str, SourceData]:
+    """Re-query a rejected page as two halves. One bad ID among n costs about 2*log2(n) queries, not n."""
+    mid = len(arxiv_ids) // 2
+    return {
+        **_fetch_arxiv_page(client, arxiv_ids[:mid], raw=raw),
+        **_fetch_arxiv_page(client, arxiv_ids[mid:], raw=raw),
+    }
+
 
-    authors = [el.findtext("atom:name", "", _ARXIV_NS) for el in entry.findall("atom:author", _ARXIV_NS)]
+def _arxiv_entry(entry: ET.Element) -> dict[str, Any]:
+    """Convert an arXiv Atom entry to a response dict."""
+    authors = [el.findtext(_ATOM + "name", "") for el in entry.findall(_ATOM + "author")]
     categories = []
-    for tag in ("arxiv:primary_category", "atom:category"):
-        for el in entry.findall(tag, _ARXIV_NS):
+    for tag in (_ARXIV + "primary_category", _ATOM + "category"):
+        for el in entry.findall(tag):
             if (term := el.get("term")) and term not in categories:
                 categories.append(term)
 
     return {
-        "source": "arxiv",
-        "request": req,
-        "status": "ok",
-        "response": {
-            "id": entry_id,
-            "title": " ".join((entry.findtext("atom:title", "", _ARXIV_NS) or "").split()),
-            "authors": authors,
-            "published": entry.findtext("atom:published", "", _ARXIV_NS),
-            "updated": entry.findtext("atom:updated", "", _ARXIV_NS),
-            "summary": (entry.findtext("atom:summary", "", _ARXIV_NS) or "").strip(),
-            "categories": categories,
-            "comment": entry.findtext("arxiv:comment", None, _ARXIV_NS),
-        },
+        "id": entry.findtext(_ATOM + "id", ""),
+        "title": " ".join((entry.findtext(_ATOM + "title", "") or "").split()),
+        "authors": authors,
+        "published": entry.findtext(_ATOM + "published", ""),
+        "updated": entry.findtext(_ATOM + "updated", ""),
+        "summary": (entry.findtext(_ATOM + "summary", "") or "").strip(),
+        "categories": categories,
+        "comment": entry.findtext(_ARXIV + "comment", None),
     }
 
 
@@ -476,7 +760,7 @@ def fetch_acl(client: httpx.Client, acl_id: str, *, raw: bool = False) -> Source
     req = {"url": url}
 
     try:
-        resp = _get(client, url)
+        resp = _get(client, url, extensions={"hishel_ttl": _BIB_RECORD_TTL})
         if not resp:
             return {"source": "acl_anthology", "request": req, "status": "no_match"}
     except httpx.HTTPError as e:
@@ -490,22 +774,23 @@ def fetch_acl(client: httpx.Client, acl_id: str, *, raw: bool = False) -> Source
 # =============================================================================
 
 
+# DOI, OpenReview, or arXiv link; the matching group's name is the paper_id type.
+_EE_ID_RE = re.compile(
+    r"https?://(?:"
+    r"doi\.org/(?P<doi>10\..+)"
+    r"|openreview\.net/forum\?id=(?P<openreview>[^&]+)"
+    r"|arxiv\.org/abs/(?P<arxiv>\d+\.\d+)"
+    r")"
+)
+
+
 def _extract_paper_id_from_ee(ee: str | None) -> str | None:
     """Extract a paper_id from a DBLP ee (external URL) field."""
     if not ee:
         return None
-    # DOI link
-    m = re.match(r"https?://doi\.org/(10\..+)", ee)
-    if m:
-        return f"doi:{m.group(1)}"
-    # OpenReview link
-    m = re.match(r"https?://openreview\.net/forum\?id=([^&]+)", ee)
-    if m:
-        return f"openreview:{m.group(1)}"
-    # arXiv link
-    m = re.match(r"https?://arxiv\.org/abs/(\d+\.\d+)", ee)
-    if m:
-        return f"arxiv:{m.group(1)}"
+    m = _EE_ID_RE.match(ee)
+    if m and m.lastgroup:
+        return f"{m.lastgroup}:{m.group(m.lastgroup)}"
     return None
 
 
@@ -539,7 +824,12 @@ def search_dblp(client: httpx.Client, title: str) -> SourceData:
         info = hit.get("info", {})
         raw_authors = info.get("authors", {}).get("author", [])
         if not isinstance(raw_authors, list):
-            raw_authors = [raw_authors]
+            raw_authors = [raw_authors]  # DBLP unwraps single-author lists
+        # Authors are uniformly {"@pid", "text"} dicts; check the shape once per hit, not per author
+        if raw_authors and isinstance(raw_authors[0], dict):
+            authors = [a.get("text", "") for a in raw_authors]
+        else:
+            authors = [str(a) for a in raw_authors]
         ee = info.get("ee")
         if isinstance(ee, list):
             ee = ee[0] if ee else None
@@ -549,7 +839,7 @@ def search_dblp(client: httpx.Client, title: str) -> SourceData:
             "year": info.get("year"),
             "type": info.get("type"),
             "key": info.get("key"),
-            "authors": [a.get("text", "") if isinstance(a, dict) else str(a) for a in raw_authors],
+            "authors": authors,
             "url": ee,
         }
         pid = _extract_paper_id_from_ee(ee)
@@ -566,52 +856,59 @@ def search_dblp(client: httpx.Client, title: str) -> SourceData:
     }
 
 
+def _search_openreview_api(client: httpx.Client, base: str, version: str, title: str) -> tuple[dict, list[dict]]:
+    """Search one OpenReview API version. Returns (request info, hits)."""
+    url = f"{base}/notes/search"
+    params = {"query": title, "limit": "10", "source": "forum"}
+    req = {"url": url, "params": params, "api": version}
+
+    try:
+        resp = _get(client, url, params=params)
+    except httpx.HTTPError as e:
+        req["error"] = str(e)
+        return req, []
+
+    if not resp:
+        req["error"] = "no response"
+        return req, []
+
+    notes = resp.json().get("notes", [])
+    req["result_count"] = len(notes)
+    hits = []
+    for note in notes:
+        hit = _or_note_to_dict(note, raw=False)
+        hit["_api"] = version
+        forum_id = note.get("id") or note.get("forum")
+        if forum_id:
+            hit["paper_id"] = f"openreview:{forum_id}"
+        hits.append(hit)
+    return req, hits
+
+
 def search_openreview(client: httpx.Client, title: str) -> SourceData:
-    """Search OpenReview by title. Queries both API v1 and v2, returns all results."""
+    """Search OpenReview by title. Queries both API v1 and v2, returns all results.
+
+    The two APIs are separate hosts with separate rate limiters, so they are queried concurrently.
+    """
     endpoints = [
         ("https://api2.openreview.net", "v2"),
         ("https://api.openreview.net", "v1"),
     ]
-    all_hits: list[dict] = []
+    with ThreadPoolExecutor(max_workers=len(endpoints)) as pool:
+        # map keeps endpoint order, so v2 hits still win deduplication
+        pages = list(pool.map(lambda ep: _search_openreview_api(client, *ep, title), endpoints))
+    # One pass: collect request info and deduplicate hits by forum ID
     requests: list[dict] = []
-
-    for base, version in endpoints:
-        url = f"{base}/notes/search"
-        params = {"query": title, "limit": "10", "source": "forum"}
-        req = {"url": url, "params": params, "api": version}
-
-        try:
-            resp = _get(client, url, params=params)
-        except httpx.HTTPError as e:
-            req["error"] = str(e)
-            requests.append(req)
-            continue
-
-        if not resp:
-            req["error"] = "no response"
-            requests.append(req)
-            continue
-
-        notes = resp.json().get("notes", [])
-        req["result_count"] = len(notes)
-        requests.append(req)
-        for note in notes:
-            hit = _or_note_to_dict(note, raw=False)
-            hit["_api"] = version
-            forum_id = note.get("id") or note.get("forum")
-            if forum_id:
-                hit["paper_id"] = f"openreview:{forum_id}"
-            all_hits.append(hit)
-
-    # Deduplicate by forum ID
     seen: set[str] = set()
     unique: list[dict] = []
-    for hit in all_hits:
-        fid = hit.get("forum") or hit.get("id") or ""
-        if fid in seen:
-            continue
-        seen.add(fid)
-        unique.append(hit)
+    for req, hits in pages:
+        requests.append(req)
+        for hit in hits:
+            fid = hit.get("forum") or hit.get("id") or ""
+            if fid in seen:
+                continue
+            seen.add(fid)
+            unique.append(hit)
 
     return {
         "source": "openreview",
@@ -622,10 +919,24 @@ def search_openreview(client: httpx.Client, title: str) -> SourceData:
     }
 
 
+# Only what search_crossref reads. Full works carry reference lists, licenses, funders, etc.,
+# often most of a 10-row page; select= has CrossRef leave them out.
+_CROSSREF_SEARCH_FIELDS = "DOI,title,author,container-title,type,issued,page,volume"
+
+
+def _crossref_year(item: dict) -> str:
+    """Year from a CrossRef work's ``issued`` date-parts, or '—'. Tolerates missing or empty parts."""
+    issued = item.get("issued")
+    parts = issued.get("date-parts") if issued else None
+    if parts and parts[0] and parts[0][0]:
+        return str(parts[0][0])
+    return "—"
+
+
 def search_crossref(client: httpx.Client, title: str) -> SourceData:
     """Search CrossRef by title. Returns all matching works."""
     url = "https://api.crossref.org/works"
-    params = {"query": title, "rows": "10"}
+    params = {"query": title, "rows": "10", "select": _CROSSREF_SEARCH_FIELDS}
     req = {"url": url, "params": params}
 
     try:
@@ -646,7 +957,7 @@ def search_crossref(client: httpx.Client, title: str) -> SourceData:
             "container-title": (item.get("container-title") or ["—"])[0],
             "type": item.get("type"),
             "DOI": doi,
-            "year": str(item.get("issued", {}).get("date-parts", [[None]])[0][0] or "—"),
+            "year": _crossref_year(item),
             "authors": authors,
             "page": item.get("page"),
             "volume": item.get("volume"),
@@ -677,26 +988,27 @@ def search_arxiv(client: httpx.Client, title: str) -> SourceData:
     except httpx.HTTPError as e:
         return _error("arxiv", req, str(e))
 
-    root = ET.fromstring(resp.text)
+    try:
+        root = ET.fromstring(resp.content)
+    except ET.ParseError as e:
+        return _error("arxiv", req, f"malformed response: {e}")
     results = []
-    for entry in root.findall("atom:entry", _ARXIV_NS):
-        entry_id = entry.findtext("atom:id", "", _ARXIV_NS)
+    for entry in root.findall(_ATOM + "entry"):
+        entry_id = entry.findtext(_ATOM + "id", "")
         if "error" in entry_id.lower():
-            continue
-        authors = [el.findtext("atom:name", "", _ARXIV_NS) for el in entry.findall("atom:author", _ARXIV_NS)]
-        categories = [el.get("term", "") for el in entry.findall("arxiv:primary_category", _ARXIV_NS)]
-        arxiv_match = re.search(r"arxiv\.org/abs/(\d+\.\d+)", entry_id)
-        hit: dict[str, Any] = {
-            "title": " ".join((entry.findtext("atom:title", "", _ARXIV_NS) or "").split()),
-            "id": entry_id,
-            "authors": authors,
-            "published": entry.findtext("atom:published", "", _ARXIV_NS)[:10],
-            "categories": categories,
-            "comment": entry.findtext("arxiv:comment", None, _ARXIV_NS),
-        }
-        if arxiv_match:
-            hit["paper_id"] = f"arxiv:{arxiv_match.group(1)}"
-        results.append(hit)
+            continue  # checked before building the full entry dict
+        info = _arxiv_entry(entry)
+        results.append(
+            {
+                "title": info["title"],
+                "id": entry_id,
+                "authors": info["authors"],
+                "published": info["published"][:10],
+                "categories": info["categories"][:1],  # primary category comes first
+                "comment": info["comment"],
+                "paper_id": f"arxiv:{_arxiv_id_from_entry(entry_id)}",
+            }
+        )
 
     return {
         "source": "arxiv",
@@ -724,19 +1036,21 @@ def search_s2(client: httpx.Client, title: str) -> SourceData:
     results = []
     for paper in data:
         ext = paper.get("externalIds") or {}
+        doi = ext.get("DOI")
+        arxiv_id = ext.get("ArXiv")
         entry: dict[str, Any] = {
             "title": paper.get("title"),
             "venue": paper.get("venue"),
             "year": paper.get("year"),
             "authors": [a.get("name", "") for a in paper.get("authors", [])],
-            "DOI": ext.get("DOI"),
-            "ArXiv": ext.get("ArXiv"),
+            "DOI": doi,
+            "ArXiv": arxiv_id,
             "DBLP": ext.get("DBLP"),
         }
-        if ext.get("DOI"):
-            entry["paper_id"] = f"doi:{ext['DOI']}"
-        elif ext.get("ArXiv"):
-            entry["paper_id"] = f"arxiv:{ext['ArXiv']}"
+        if doi:
+            entry["paper_id"] = f"doi:{doi}"
+        elif arxiv_id:
+            entry["paper_id"] = f"arxiv:{arxiv_id}"
         results.append(entry)
 
     return {
@@ -789,12 +1103,14 @@ _SOURCE_META: dict[str, dict[str, str]] = {
     },
 }
 
+# batch_fn: {id: result} for many IDs, like resolve_s2_batch: one round-trip (and one rate-limit interval)
+# per page of IDs instead of one per ID. fetch_many uses it instead of one fn call per paper.
 _FETCH_SOURCES: dict[str, dict[str, Any]] = {
     "dblp": {"fn": fetch_dblp, "id_field": "dblp_key"},
-    "crossref": {"fn": fetch_crossref, "id_field": "doi"},
+    "crossref": {"fn": fetch_crossref, "id_field": "doi", "batch_fn": fetch_crossref_batch},
     "openreview": {"fn": fetch_openreview, "id_field": "openreview_id"},
     "acl_anthology": {"fn": fetch_acl, "id_field": "acl_id"},
-    "arxiv": {"fn": fetch_arxiv, "id_field": "arxiv_id"},
+    "arxiv": {"fn": fetch_arxiv, "id_field": "arxiv_id", "batch_fn": fetch_arxiv_batch},
 }
 
 ALL_SOURCES = list(_FETCH_SOURCES)
@@ -814,26 +1130,48 @@ def _extract_ids(s2_data: dict) -> dict[str, str | None]:
     }
 
 
-def _resolve_ids(client: httpx.Client, pid: PaperId, log: Console) -> tuple[SourceData, dict[str, str | None]]:
-    """Resolve paper ID to a complete set of IDs. Returns (s2_result, ids_dict)."""
-    log.print(f"[dim]Resolving {pid.type}:{pid.value} via Semantic Scholar…[/]")
-    s2 = resolve_s2(client, pid)
+def _merge_ids(pid: PaperId, s2: SourceData) -> dict[str, str | None]:
+    """IDs from an S2 result with gaps filled from the input ID; only the input's IDs if S2 failed."""
+    input_ids = pid.to_ids()
+    if s2["status"] != "ok":
+        return input_ids  # nothing to merge: these already are the input-derived IDs
+    ids = _extract_ids(s2["response"])
+    for k, v in input_ids.items():
+        if v and not ids.get(k):
+            ids[k] = v
+    return ids
 
-    if s2["status"] == "ok":
-        ids = _extract_ids(s2["response"])
+
+def _resolve_ids(
+    client: httpx.Client,
+    pid: PaperId,
+    log: Console,
+    *,
+    s2: SourceData | None = None,
+    crossref: tuple[str, Future[SourceData]] | None = None,
+) -> tuple[SourceData, dict[str, str | None]]:
+    """Resolve paper ID to a complete set of IDs. Returns (s2_result, ids_dict).
+
+    s2: an S2 result already fetched for this ID (e.g. by resolve_s2_batch); resolved here if None.
+    crossref: an already-submitted (doi, fetch_crossref future), reused for the title fallback if the DOI matches.
+    """
+    if s2 is None:
+        log.print(f"[dim]Resolving {pid.type}:{pid.value} via Semantic Scholar…[/]")
+        s2 = resolve_s2(client, pid)
     else:
-        log.print("[yellow]  S2 resolution failed, extracting IDs from input…[/]")
-        ids = pid.to_ids()
+        log.print(f"[dim]{pid.type}:{pid.value}[/]")
 
-    # Merge input-derived IDs to fill gaps
-    for k, v in pid.to_ids().items():
-        if v and not ids.get(k):
-            ids[k] = v
+    if s2["status"] != "ok":
+        log.print("[yellow]  S2 resolution failed, extracting IDs from input…[/]")
+    ids = _merge_ids(pid, s2)
 
     # If we have DOI but no title (S2 failed), get title from CrossRef
     if ids.get("doi") and not ids.get("title"):
         log.print("[dim]  Fetching title from CrossRef…[/]")
-        cr = fetch_crossref(client, ids["doi"])  # type: ignore[arg-type]  # guarded by ids.get("doi") above
+        if crossref is not None and _same_id("doi", crossref[0], ids["doi"]):
+            cr = crossref[1].result()  # already in flight; don't queue a second request behind the rate limiter
+        else:
+            cr = fetch_crossref(client, ids["doi"])  # type: ignore[arg-type]  # guarded by ids.get("doi") above
         if cr["status"] == "ok":
             titles = cr["response"].get("title", [])
             if titles:
@@ -854,59 +1192,156 @@ def fetch_all(
     *,
     sources: list[str] | None = None,
     raw: bool = False,
+    cache: bool = True,
 ) -> list[SourceData]:
-    """Exact ID-based fetch from all sources. No fuzzy matching."""
+    """Exact ID-based fetch from all sources. No fuzzy matching.
+
+    Sources live on different hosts with independent rate limiters, so they are fetched concurrently.
+    Sources whose ID is already in the input start right away instead of waiting for S2 resolution.
+    """
     enabled = sources or ALL_SOURCES
-    results: list[SourceData] = []
 
-    with _make_client() as client:
-        s2, ids = _resolve_ids(client, pid, log)
-        results.append(s2)
+    with _make_client(cache=cache) as client, ThreadPoolExecutor(max_workers=len(_FETCH_SOURCES)) as pool:
+        # DBLP is left out: it also wants the resolved title and DOI.
+        early: dict[str, tuple[str, Future[SourceData]]] = {}
+        input_ids = pid.to_ids()
+        for name, spec in _FETCH_SOURCES.items():
+            input_val = input_ids.get(spec["id_field"])
+            if input_val and name in enabled and name != "dblp":
+                early[name] = (input_val, pool.submit(spec["fn"], client, input_val, raw=raw))
 
+        s2, ids = _resolve_ids(client, pid, log, crossref=early.get("crossref"))
+        return [s2, *_fetch_sources(client, pool, ids, log, enabled=enabled, raw=raw, ready=early)]
+
+
+def fetch_many(
+    pids: list[PaperId],
+    log: Console,
+    *,
+    sources: list[str] | None = None,
+    raw: bool = False,
+    cache: bool = True,
+) -> list[list[SourceData]]:
+    """fetch_all for several papers, in input order, sharing one client and batching where APIs allow.
+
+    S2 resolution, and sources with a batch_fn, take one request per page of IDs instead of one per paper;
+    with arXiv's 3.5s interval that is most of the wall time for a reference list. A paper cited twice, or
+    under two IDs that resolve to the same set, is fetched once.
+    """
+    enabled = sources or ALL_SOURCES
+    unique = list(dict.fromkeys(pids))
+
+    with _make_client(cache=cache) as client, ThreadPoolExecutor(max_workers=len(_FETCH_SOURCES)) as pool:
+        log.print(f"[dim]Resolving {len(unique)} IDs via Semantic Scholar…[/]")
+        s2_results = resolve_s2_batch(client, unique)
+        # Every source ID is known once S2 answers (_resolve_ids only adds a missing title), so the batches go
+        # out now, and the CrossRef one also serves _resolve_ids' title fallback instead of a second request.
+        merged = [_merge_ids(pid, s2) for pid, s2 in zip(unique, s2_results, strict=True)]
+        batches: dict[str, Future[dict[str, SourceData]]] = {}
         for name, spec in _FETCH_SOURCES.items():
-            if name not in enabled:
-                results.append(_skipped(name, "disabled"))
-                continue
+            wanted = list(dict.fromkeys(ids[spec["id_field"]] for ids in merged if ids.get(spec["id_field"])))
+            if "batch_fn" in spec and name in enabled and wanted:
+                batches[name] = pool.submit(spec["batch_fn"], client, wanted, raw=raw)
+
+        def from_batch(name: str, ids: dict[str, str | None]) -> tuple[str, Future[SourceData]] | None:
+            id_val = ids.get(_FETCH_SOURCES[name]["id_field"])
+            return (id_val, _batch_item(batches[name], id_val)) if name in batches and id_val else None
+
+        resolved = [
+            _resolve_ids(client, pid, log, s2=s2, crossref=from_batch("crossref", ids))
+            for pid, s2, ids in zip(unique, s2_results, merged, strict=True)
+        ]
+
+        by_ids: dict[tuple[tuple[str, str | None], ...], list[SourceData]] = {}
+        by_pid: dict[PaperId, list[SourceData]] = {}
+        for pid, (s2, ids) in zip(unique, resolved, strict=True):
+            key = tuple(sorted(ids.items()))
+            if key not in by_ids:
+                log.print(f"[bold]{pid.type}:{pid.value}[/]")
+                ready = {name: item for name in batches if (item := from_batch(name, ids))}
+                by_ids[key] = _fetch_sources(client, pool, ids, log, enabled=enabled, raw=raw, ready=ready)
+            by_pid[pid] = [s2, *by_ids[key]]
+        return [by_pid[pid] for pid in pids]
+
+
+def _batch_item(batch: Future[dict[str, SourceData]], key: str) -> Future[SourceData]:
+    """Future for one ID's result out of a batch_fn future."""
+    item: Future[SourceData] = Future()
+
+    def settle(done: Future[dict[str, SourceData]]) -> None:
+        if (e := done.exception()) is not None:
+            item.set_exception(e)  # hand the batch's failure to whoever waits on this ID
+        else:
+            item.set_result(done.result()[key])
 
-            id_field = spec["id_field"]
-            id_val = ids.get(id_field)
+    batch.add_done_callback(settle)
+    return item
 
-            # DBLP: pass title for local DB lookup, and DOI for direct fallback
-            extra_kwargs: dict[str, Any] = {}
-            if name == "dblp":
-                if ids.get("title"):
-                    extra_kwargs["title"] = ids["title"]
-                if ids.get("doi"):
-                    extra_kwargs["doi"] = ids["doi"]
 
-            if not id_val and not extra_kwargs:
-                results.append(_skipped(name, f"no {id_field}"))
-                log.print(f"  [dim]{name}: skipped (no {id_field})[/]")
-                continue
+def _fetch_sources(
+    client: httpx.Client,
+    pool: ThreadPoolExecutor,
+    ids: dict[str, str | None],
+    log: Console,
+    *,
+    enabled: list[str],
+    raw: bool,
+    ready: dict[str, tuple[str, Future[SourceData]]],
+) -> list[SourceData]:
+    """Fetch every enabled source for one paper's resolved IDs, in _FETCH_SOURCES order.
 
-            log.print(f"  [dim]{name}: fetching…[/]", end="")
-            if id_val:
-                result = spec["fn"](client, id_val, raw=raw, **extra_kwargs)
-            else:
-                # DBLP with title but no key — try local only
-                result = spec["fn"](client, "", raw=raw, **extra_kwargs)
-            results.append(result)
-
-            status = result["status"]
-            if status == "ok":
-                log.print(" [green]ok[/]")
-            elif status == "no_match":
-                log.print(" [yellow]no match[/]")
-            else:
-                log.print(f" [red]{result.get('error', 'error')}[/]")
+    ready: (id, future) per source, already submitted or fetched; used instead of a new request when the ID matches.
+    """
+    by_source: dict[str, SourceData] = {}
+    futures = {}
+    for name, spec in _FETCH_SOURCES.items():
+        if name not in enabled:
+            by_source[name] = _skipped(name, "disabled")
+            continue
 
-    return results
+        id_field = spec["id_field"]
+        id_val = ids.get(id_field)
+
+        # DBLP: pass title for local DB lookup, and DOI for direct fallback
+        extra_kwargs: dict[str, Any] = {}
+        if name == "dblp":
+            if ids.get("title"):
+                extra_kwargs["title"] = ids["title"]
+            if ids.get("doi"):
+                extra_kwargs["doi"] = ids["doi"]
+
+        if not id_val and not extra_kwargs:
+            by_source[name] = _skipped(name, f"no {id_field}")
+            log.print(f"  [dim]{name}: skipped (no {id_field})[/]")
+            continue
+
+        if name in ready and _same_id(id_field, ready[name][0], id_val):
+            futures[ready[name][1]] = name
+            continue
+
+        # DBLP with title but no key gets "" — tries local only
+        futures[pool.submit(spec["fn"], client, id_val or "", raw=raw, **extra_kwargs)] = name
+
+    for future in as_completed(futures):
+        name = futures[future]
+        result = by_source[name] = future.result()
+        status = result["status"]
+        if status == "ok":
+            log.print(f"  [dim]{name}:[/] [green]ok[/]")
+        elif status == "no_match":
+            log.print(f"  [dim]{name}:[/] [yellow]no match[/]")
+        else:
+            log.print(f"  [dim]{name}:[/] [red]{result.get('error', 'error')}[/]")
+
+    return [by_source[name] for name in _FETCH_SOURCES]
 
 
 def search_one(
     source: str,
     title: str,
     log: Console,
+    *,
+    cache: bool = True,
 ) -> list[SourceData]:
     """Search a single source by title."""
     search_fn = _SEARCH_SOURCES.get(source)
@@ -915,7 +1350,7 @@ def search_one(
 
     log.print(f'[dim]Searching by title: "{title}"[/]\n')
 
-    with _make_client() as client:
+    with _make_client(cache=cache) as client:
         log.print(f"  [dim]{source}: searching…[/]", end="")
         result = search_fn(client, title)
         n = result.get("response", {}).get("total", 0) if result["status"] == "ok" else 0
@@ -933,8 +1368,6 @@ def _format_url(req: dict) -> str:
     url = req.get("url", "")
     params = req.get("params")
     if params:
-        from urllib.parse import urlencode
-
         return url + "?" + urlencode(params)
     return url
 
@@ -1064,29 +1497,33 @@ def display_search(results: list[SourceData], console: Console) -> None:
         display_fields = _SEARCH_DISPLAY_FIELDS.get(name, [])
         id_fields = _SEARCH_ID_FIELDS.get(name, [])
 
+        # Hits are assembled as styled Text, not markup strings: no markup parsing per line,
+        # and titles like "[Re] ..." print verbatim. One print call per hit.
         for i, hit in enumerate(hits, 1):
-            title = hit.get("title", "—")
             authors_list = hit.get("authors", [])
             authors = ", ".join(authors_list[:3])
             if len(authors_list) > 3:
                 authors += " et al."
 
-            console.print(f"  [bold][{i}][/] {title}")
+            lines = [Text.assemble("  ", (f"[{i}]", "bold"), " ", str(hit.get("title", "—")))]
 
             # Render declared display fields
-            fields_str = "  ".join(
-                f"[cyan]{label}[/]={_format_field_value(hit.get(key, '—'))}" for key, label in display_fields
-            )
-            if fields_str:
-                console.print(f"      {fields_str}")
+            if display_fields:
+                fields = Text("    ")
+                for key, label in display_fields:
+                    fields.append("  ")
+                    fields.append(label, "cyan")
+                    fields.append(f"={_format_field_value(hit.get(key, '—'))}")
+                lines.append(fields)
 
             # Render ID fields
             ids = [f"{k}={hit[k]}" for k in id_fields if hit.get(k)]
             if ids:
-                console.print(f"      [dim]{', '.join(ids)}[/]")
+                lines.append(Text(f"      {', '.join(ids)}", "dim"))
 
-            console.print(f"      [dim]{authors}[/]")
-            console.print()
+            lines.append(Text(f"      {authors}", "dim"))
+            lines.append(Text())
+            console.print(Text("\n").join(lines))
 
 
 def _format_field_value(val: Any) -> str:
@@ -1111,19 +1548,24 @@ def _clean(d: Any) -> Any:
 
 
 def _inject_meta(results: list[SourceData]) -> list[SourceData]:
+    """Clean each result and attach its source's _meta in a single pass."""
     enriched = []
     for data in results:
-        name = data.get("source", "")
-        meta = _SOURCE_META.get(name)
+        cleaned = _clean(data)  # fresh dict, so _meta can be added in place
+        meta = _SOURCE_META.get(data.get("source", ""))
         if meta and data.get("status") not in ("skipped",):
-            data = {**data, "_meta": meta}
-        enriched.append(data)
+            cleaned["_meta"] = _clean(meta)
+        enriched.append(cleaned)
     return enriched
 
 
 def display_json(results: list[SourceData]) -> None:
-    enriched = _inject_meta(results)
-    print(json.dumps(_clean(enriched), indent=2, ensure_ascii=False))
+    print(json.dumps(_inject_meta(results), indent=2, ensure_ascii=False))
+
+
+def display_json_many(many: list[list[SourceData]]) -> None:
+    """One display_json array per paper, wrapped in an outer array in input order."""
+    print(json.dumps([_inject_meta(results) for results in many], indent=2, ensure_ascii=False))
 
 
 def display_raw(results: list[SourceData], source_name: str) -> None:
@@ -1167,7 +1609,7 @@ FetchSource = Enum("FetchSource", {k: k for k in _FETCH_SOURCES}, type=str)  # t
 
 def _require_s2_key(allow_no_s2_key: bool) -> None:
     """Exit if S2 API key is missing and --allow-no-s2-key not set."""
-    if not os.environ.get("SEMANTIC_SCHOLAR_API_KEY") and not allow_no_s2_key:
+    if not _S2_API_KEY and not allow_no_s2_key:
         typer.echo(
             "Error: SEMANTIC_SCHOLAR_API_KEY not set. "
             "Use --allow-no-s2-key to proceed without it (slower rate limits).",
@@ -1185,20 +1627,24 @@ app = typer.Typer(
 
 @app.command()
 def fetch(
-    paper_id: Annotated[str, typer.Argument(help="arxiv:ID, doi:ID, dblp:KEY, or openreview:ID")],
+    paper_ids: Annotated[list[str], typer.Argument(help="one or more of arxiv:ID, doi:ID, dblp:KEY, openreview:ID")],
     json_output: Annotated[bool, typer.Option("--json", help="output as JSON array with _meta per source")] = False,
     sources: Annotated[Optional[str], typer.Option(help="comma-separated list of sources (default: all)")] = None,
     raw: Annotated[Optional[FetchSource], typer.Option(help="full unfiltered API response from one source")] = None,
     allow_no_s2_key: Annotated[
         bool, typer.Option("--allow-no-s2-key", help="proceed without S2 API key (slower rate limits)")
     ] = False,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="bypass the local HTTP cache")] = False,
 ) -> None:
-    """Exact ID-based fetch from all sources (no fuzzy matching)."""
+    """Exact ID-based fetch from all sources (no fuzzy matching).
+
+    Several IDs are fetched in one run, batching S2, arXiv and CrossRef requests across papers.
+    """
     log = Console(stderr=True)
     _require_s2_key(allow_no_s2_key)
 
     try:
-        pid = PaperId.parse(paper_id)
+        pids = [PaperId.parse(paper_id) for paper_id in paper_ids]
     except ValueError as e:
         typer.echo(f"Error: {e}", err=True)
         raise typer.Exit(1) from None
@@ -1213,15 +1659,32 @@ def fetch(
             )
             raise typer.Exit(1)
 
+    if len(pids) > 1:
+        if raw:
+            typer.echo("Error: --raw takes a single paper ID", err=True)
+            raise typer.Exit(1)
+        many = fetch_many(pids, log, sources=src_list, cache=not no_cache)
+        if json_output:
+            display_json_many(many)
+        else:
+            with Console() as out:
+                for pid, results in zip(pids, many):
+                    out.rule(f"[bold]{pid.type}:{pid.value}[/]", characters="═")
+                    display_rich(results, out)
+        return
+
+    pid = pids[0]
     if raw:
-        results = fetch_all(pid, log, sources=[raw.value], raw=True)
+        results = fetch_all(pid, log, sources=[raw.value], raw=True, cache=not no_cache)
         display_raw(results, raw.value)
     elif json_output:
-        results = fetch_all(pid, log, sources=src_list)
+        results = fetch_all(pid, log, sources=src_list, cache=not no_cache)
         display_json(results)
     else:
-        results = fetch_all(pid, log, sources=src_list)
-        display_rich(results, Console())
+        results = fetch_all(pid, log, sources=src_list, cache=not no_cache)
+        # Buffered: every line is still rendered, but the report reaches the terminal in one write.
+        with Console() as out:
+            display_rich(results, out)
 
 
 @app.command()
@@ -1232,16 +1695,18 @@ def search(
     allow_no_s2_key: Annotated[
         bool, typer.Option("--allow-no-s2-key", help="proceed without S2 API key (slower rate limits)")
     ] = False,
+    no_cache: Annotated[bool, typer.Option("--no-cache", help="bypass the local HTTP cache")] = False,
 ) -> None:
     """Search a single source by title."""
     log = Console(stderr=True)
     if source.value == "s2":
         _require_s2_key(allow_no_s2_key)
-    results = search_one(source.value, query, log)
+    results = search_one(source.value, query, log, cache=not no_cache)
     if json_output:
         display_json(results)
     else:
-        display_search(results, Console())
+        with Console() as out:
+            display_search(results, out)
 
 
 if __name__ == "__main__":